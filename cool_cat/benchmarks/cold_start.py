@@ -0,0 +1,52 @@
+"""Замер холодного старта: от импорта до первой отрисовки окна.
+
+Идёт тот же поэтапный путь, что и `python -m cool_cat.main` (`main.start`):
+разбор аргументов, окно без TTS, голоса и картинка в фоне.
+
+Запускается в отдельном процессе, чтобы модули и Qt ещё не были загружены:
+`python -m cool_cat.benchmarks.cold_start` печатает время в секундах.
+"""
+
+import time
+
+START = time.perf_counter()
+
+import os  # noqa: E402
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6 import QtCore  # noqa: E402
+
+from ..main import start  # noqa: E402
+
+FIRST_PAINT_TIMEOUT_MS = 10_000
+
+
+class _FirstPaintWatcher(QtCore.QObject):
+    def __init__(self) -> None:
+        super().__init__()
+        self.painted_at: float | None = None
+
+    def eventFilter(self, watched: QtCore.QObject, event: QtCore.QEvent) -> bool:
+        if event.type() == QtCore.QEvent.Type.Paint and self.painted_at is None:
+            self.painted_at = time.perf_counter()
+            QtCore.QTimer.singleShot(0, QtCore.QCoreApplication.quit)
+        return False
+
+
+def main() -> int:
+    app, _window = start(["cool_cat"])
+    # Отрисовка начинается только в цикле событий, поэтому фильтр успевает.
+    watcher = _FirstPaintWatcher()
+    app.installEventFilter(watcher)
+    QtCore.QTimer.singleShot(FIRST_PAINT_TIMEOUT_MS, app.quit)
+    app.exec()
+    if watcher.painted_at is None:
+        print("nan")
+        return 1
+    print(f"{watcher.painted_at - START:.6f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
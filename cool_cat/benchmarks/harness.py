@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+
+from ..speech_metrics import SpeechMetrics
+from ..tts import VoiceInfo
+
+
+@dataclass
+class StubTextToSpeech:
+    """Заглушка `TextToSpeech`: ничего не озвучивает, только запоминает вызовы."""
+
+    voice: VoiceInfo = field(default_factory=lambda: VoiceInfo(name="Stub"))
+    spoken: list[tuple[str, str]] = field(default_factory=list)
+    cancelled: int = 0
+    metrics: SpeechMetrics = field(default_factory=SpeechMetrics)
+
+    def voice_info(self, language: str) -> VoiceInfo:
+        return self.voice
+
+    def speak(
+        self,
+        text: str,
+        language: str,
+        queued_at: float | None = None,
+        generation: int | None = None,
+    ) -> bool:
+        self.spoken.append((text, language))
+        return True
+
+    def cancel(self) -> None:
+        self.cancelled += 1
+
+    def next_generation(self) -> int:
+        return 0
+
+
+def offscreen_app():
+    """Возвращает `QApplication`, созданный без дисплея (QT_QPA_PLATFORM=offscreen)."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6 import QtWidgets
+
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication([])
+    return app
+
+
+def make_window(tts=None, cat_state=None):
+    from ..cat_state import CatState
+    from ..ui import CoolCatWindow
+
+    offscreen_app()
+    window = CoolCatWindow(
+        tts=tts if tts is not None else StubTextToSpeech(),
+        cat_state=cat_state if cat_state is not None else CatState(),
+    )
+    window.resize(1200, 860)
+    return window
@@ -0,0 +1,265 @@
+"""Бенчмарки горячих путей UI без дисплея (QT_QPA_PLATFORM=offscreen).
+
+Запуск:
+    python -m cool_cat.benchmarks.run --output results.json
+    python -m cool_cat.benchmarks.run --update-baseline
+
+Результаты сравниваются с `baseline.json`; при регрессии медианы больше
+допуска процесс завершается с кодом 1. Базовая линия с другой ОС,
+архитектуры или версии Python (major.minor), как и прогон с малым
+`--repeat`, даёт только предупреждения.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Iterator
+
+from .harness import make_window, offscreen_app
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+DEFAULT_TOLERANCE = 0.5
+# Медианы в единицы микросекунд шумят сильнее допуска, поэтому регрессией
+# считается только рост хотя бы на столько миллисекунд.
+MIN_REGRESSION_DELTA_MS = 0.05
+MIN_REPEAT_FOR_COMPARE = 20
+# Поля `meta`, по которым базовую линию можно считать своей; полная строка
+# `platform` включает сборку ядра и сохраняется только для справки.
+COMPARABLE_META_KEYS = ("system", "machine", "python")
+
+RESIZE_SIZES = [(800, 600), (1200, 860), (1600, 1200), (2400, 1600)]
+LOG_FILL_LEVELS = [0, 1_000, 5_000, 20_000]
+TICK_ELAPSED = [1.0, 1e3, 1e5, 1e6]
+
+
+def _summarize(samples: list[float]) -> dict[str, float | int | str]:
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+    return {
+        "unit": "ms",
+        "runs": len(ordered),
+        "min": ordered[0] * 1e3,
+        "median": statistics.median(ordered) * 1e3,
+        "p95": p95 * 1e3,
+    }
+
+
+def measure(
+    action: Callable[[], object],
+    repeat: int,
+    setup: Callable[[], object] | None = None,
+) -> dict[str, float | int | str]:
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        action()
+        samples.append(time.perf_counter() - start)
+    return _summarize(samples)
+
+
+@contextlib.contextmanager
+def _cat_image() -> Iterator[None]:
+    """Подставляет синтетическую картинку, если в дереве нет `assets/cat.png`."""
+    from PySide6 import QtGui
+
+    from .. import ui
+
+    if ui.CAT_IMAGE_PATH.exists():
+        yield
+        return
+    original = ui.CAT_IMAGE_PATH
+    with tempfile.TemporaryDirectory() as tmp:
+        image = QtGui.QImage(2048, 2048, QtGui.QImage.Format.Format_ARGB32)
+        image.fill(QtGui.QColor("#d08040"))
+        path = Path(tmp) / "cat.png"
+        image.save(str(path))
+        ui.CAT_IMAGE_PATH = path
+        try:
+            yield
+        finally:
+            ui.CAT_IMAGE_PATH = original
+
+
+def bench_handlers(repeat: int) -> dict[str, dict]:
+    from ..cat_state import CatState
+
+    window = make_window(cat_state=CatState(satiety=90))
+    window.show()
+    results = {
+        "handle_feed": measure(window.handle_feed, repeat, setup=window.log_box.clear),
+        "handle_pet": measure(window.handle_pet, repeat, setup=window.log_box.clear),
+    }
+
+    def prepare_speak() -> None:
+        window.log_box.clear()
+        window.cat_state.satiety = 90
+        window.text_input.setText("Привет, кот! Как дела?")
+
+    results["handle_speak"] = measure(window.handle_speak, repeat, setup=prepare_speak)
+
+    def prepare_refusal() -> None:
+        prepare_speak()
+        window.cat_state.satiety = 0
+
+    results["handle_speak_hungry"] = measure(window.handle_speak, repeat, setup=prepare_refusal)
+    window.close()
+    return results
+
+
+def bench_update_cat_image(repeat: int) -> dict[str, dict]:
+    app = offscreen_app()
+    window = make_window()
+    window.show()
+    window.load_cat_image()
+    results = {}
+    for width, height in RESIZE_SIZES:
+        window.resize(width, height)
+        app.processEvents()
+        results[f"update_cat_image@{width}x{height}"] = measure(window.update_cat_image, repeat)
+    window.close()
+    return results
+
+
+def bench_add_log(repeat: int) -> dict[str, dict]:
+    window = make_window()
+    results = {}
+    for level in LOG_FILL_LEVELS:
+        window.log_box.clear()
+        for index in range(level):
+            window.add_log(f"Кот: строка {index}")
+        results[f"add_log@{level}"] = measure(lambda: window.add_log("Кот: ещё строка"), repeat)
+    window.close()
+    return results
+
+
+def bench_tick(repeat: int) -> dict[str, dict]:
+    from ..cat_state import CatState
+
+    results = {}
+    for elapsed in TICK_ELAPSED:
+        state = CatState()
+
+        def reset(state: CatState = state) -> None:
+            state.satiety = 60
+            state._decay_elapsed = 0.0
+
+        results[f"cat_state_tick@{elapsed:.0f}s"] = measure(
+            lambda state=state, elapsed=elapsed: state.tick(elapsed),
+            repeat,
+            setup=reset,
+        )
+    return results
+
+
+def bench_cold_start(repeat: int) -> dict[str, dict]:
+    samples = []
+    for _ in range(repeat):
+        completed = subprocess.run(
+            [sys.executable, "-m", "cool_cat.benchmarks.cold_start"],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        samples.append(float(completed.stdout.strip()))
+    return {"cold_start_first_paint": _summarize(samples)}
+
+
+def run_all(repeat: int, cold_start_repeat: int) -> dict[str, dict]:
+    offscreen_app()
+    results: dict[str, dict] = {}
+    with _cat_image():
+        results.update(bench_handlers(repeat))
+        results.update(bench_update_cat_image(repeat))
+    results.update(bench_add_log(repeat))
+    results.update(bench_tick(repeat))
+    results.update(bench_cold_start(cold_start_repeat))
+    return results
+
+
+def compare(
+    results: dict[str, dict],
+    baseline: dict[str, dict],
+    tolerance: float = DEFAULT_TOLERANCE,
+    min_delta_ms: float = MIN_REGRESSION_DELTA_MS,
+) -> list[str]:
+    """Возвращает описания регрессий медианы относительно базовой линии."""
+    regressions = []
+    for name, current in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        limit = max(reference["median"] * (1 + tolerance), reference["median"] + min_delta_ms)
+        if current["median"] > limit:
+            regressions.append(
+                f"{name}: {current['median']:.4f} ms > {reference['median']:.4f} ms (+{tolerance:.0%})"
+            )
+    return regressions
+
+
+def current_meta() -> dict[str, str]:
+    return {
+        "system": platform.system(),
+        "machine": platform.machine(),
+        "python": ".".join(platform.python_version_tuple()[:2]),
+        "platform": platform.platform(),
+    }
+
+
+def same_environment(baseline_meta: dict[str, str], meta: dict[str, str]) -> bool:
+    return all(baseline_meta.get(key) == meta.get(key) for key in COMPARABLE_META_KEYS)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Бенчмарки cool_cat без дисплея.")
+    parser.add_argument("--output", type=Path, help="Куда записать результаты в JSON.")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--cold-start-repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    report = {
+        "meta": current_meta(),
+        "results": run_all(args.repeat, args.cold_start_repeat),
+    }
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+    if args.update_baseline:
+        args.baseline.write_text(text + "\n", encoding="utf-8")
+        return 0
+    if not args.baseline.exists():
+        print(f"Нет базовой линии: {args.baseline}", file=sys.stderr)
+        return 0
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    regressions = compare(report["results"], baseline["results"], args.tolerance)
+    strict = True
+    if not same_environment(baseline.get("meta", {}), report["meta"]):
+        print("Базовая линия снята на другой ОС, архитектуре или Python: только предупреждения.", file=sys.stderr)
+        strict = False
+    if args.repeat < MIN_REPEAT_FOR_COMPARE:
+        print(f"--repeat меньше {MIN_REPEAT_FOR_COMPARE}: только предупреждения.", file=sys.stderr)
+        strict = False
+    label = "Регрессия" if strict else "Возможная регрессия"
+    for line in regressions:
+        print(f"{label}: {line}", file=sys.stderr)
+    return 1 if regressions and strict else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+import numpy as np
+
+from . import config
+from .cat_state import CatState
+
+
+class CatStateBank:
+    """Состояние множества котов в массивах NumPy.
+
+    Поведение каждого слота совпадает с `CatState`: те же правила кормления,
+    голода и накопления остатка времени до следующего уменьшения сытости.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        satiety: int = config.SATIETY_START,
+        threshold_hungry: int = config.HUNGRY_THRESHOLD,
+    ) -> None:
+        if size < 0:
+            raise ValueError("size must be non-negative")
+        self.satiety = np.full(size, satiety, dtype=np.int64)
+        self.threshold_hungry = np.full(size, threshold_hungry, dtype=np.int64)
+        self.decay_elapsed = np.zeros(size, dtype=np.float64)
+
+    @classmethod
+    def from_states(cls, states: Iterable[CatState]) -> CatStateBank:
+        states = list(states)
+        bank = cls(len(states))
+        bank.satiety[:] = [state.satiety for state in states]
+        bank.threshold_hungry[:] = [state.threshold_hungry for state in states]
+        bank.decay_elapsed[:] = [state._decay_elapsed for state in states]
+        return bank
+
+    def __len__(self) -> int:
+        return self.satiety.shape[0]
+
+    def hungry_mask(self) -> np.ndarray:
+        return self.satiety < self.threshold_hungry
+
+    def feed(self, indices) -> None:
+        """Кормит котов по индексам или по булевой маске длины `len(self)`."""
+        indices = np.asarray(indices)
+        if indices.dtype == bool:
+            if indices.shape != self.satiety.shape:
+                raise ValueError("mask length must match bank size")
+            indices = np.flatnonzero(indices)
+        elif indices.size == 0:
+            indices = indices.astype(np.intp)
+        elif not np.issubdtype(indices.dtype, np.integer):
+            raise TypeError("indices must be integers or a boolean mask")
+        # np.add.at учитывает повторяющиеся индексы: два кормления подряд
+        # дают тот же результат, что и два вызова `CatState.feed`.
+        np.add.at(self.satiety, indices, config.SATIETY_FEED_AMOUNT)
+        self.satiety[indices] = np.minimum(self.satiety[indices], config.SATIETY_MAX)
+
+    def tick(self, elapsed_seconds: float) -> np.ndarray:
+        """Продвигает время для всех котов, возвращает маску изменившихся."""
+        changed = np.zeros(len(self), dtype=bool)
+        if elapsed_seconds <= 0:
+            return changed
+        self.decay_elapsed += elapsed_seconds
+        # Вычитаем интервал по шагу, как в `CatState.tick`, чтобы остаток
+        # совпадал до бита; число итераций равно числу прошедших интервалов.
+        due = self.decay_elapsed >= config.SATIETY_DECAY_INTERVAL
+        while due.any():
+            self.decay_elapsed[due] -= config.SATIETY_DECAY_INTERVAL
+            decrement = due & (self.satiety > config.SATIETY_MIN)
+            self.satiety[decrement] -= 1
+            changed |= decrement
+            due = self.decay_elapsed >= config.SATIETY_DECAY_INTERVAL
+        return changed
+
+    def state(self, index: int) -> CatState:
+        """Снимок одного слота в виде отдельного `CatState`."""
+        state = CatState(
+            satiety=int(self.satiety[index]),
+            threshold_hungry=int(self.threshold_hungry[index]),
+        )
+        state._decay_elapsed = float(self.decay_elapsed[index])
+        return state
+
+    def view(self, index: int) -> CatStateView:
+        return CatStateView(self, index)
+
+
+class CatStateView:
+    """Один кот из `CatStateBank` с интерфейсом `CatState`.
+
+    Нужен, чтобы `CoolCatWindow` мог работать с конкретным слотом банка.
+    `tick` продвигает время только для этого слота; если весь банк тикается
+    централизованно, окно создают с `tick_state=False`.
+    """
+
+    def __init__(self, bank: CatStateBank, index: int) -> None:
+        if not -len(bank) <= index < len(bank):
+            raise IndexError("cat index out of range")
+        self.bank = bank
+        self.index = index % len(bank)
+
+    @property
+    def satiety(self) -> int:
+        return int(self.bank.satiety[self.index])
+
+    @satiety.setter
+    def satiety(self, value: int) -> None:
+        self.bank.satiety[self.index] = value
+
+    @property
+    def threshold_hungry(self) -> int:
+        return int(self.bank.threshold_hungry[self.index])
+
+    @threshold_hungry.setter
+    def threshold_hungry(self, value: int) -> None:
+        self.bank.threshold_hungry[self.index] = value
+
+    def is_hungry(self) -> bool:
+        return self.satiety < self.threshold_hungry
+
+    def feed(self) -> None:
+        self.bank.feed([self.index])
+
+    def tick(self, elapsed_seconds: float) -> bool:
+        state = self.bank.state(self.index)
+        changed = state.tick(elapsed_seconds)
+        self.bank.satiety[self.index] = state.satiety
+        self.bank.decay_elapsed[self.index] = state._decay_elapsed
+        return changed
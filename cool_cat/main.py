@@ -1,21 +1,111 @@
-import sys
+import time
 
-from PySide6 import QtWidgets
+_START = time.perf_counter()
 
-from .cat_state import CatState
-from .tts import TextToSpeech
-from .ui import CoolCatWindow
+import argparse  # noqa: E402
+import sys  # noqa: E402
+import threading  # noqa: E402
 
+from PySide6 import QtCore, QtWidgets  # noqa: E402
+
+from .cat_state import CatState  # noqa: E402
+from .ui import CoolCatWindow  # noqa: E402
+
+STARTUP_PHASES = ("imports", "app", "window", "show", "first_paint")
+BACKGROUND_PHASES = ("image", "tts")
+
+
+class StartupProfiler(QtCore.QObject):
+    """Собирает время фаз запуска и печатает сводку, когда все фазы пройдены.
+
+    Последовательные фазы меряются от предыдущей отметки, фоновые (`image`,
+    `tts`) — от собственного старта в своём потоке.
+    """
+
+    def __init__(self, enabled: bool) -> None:
+        super().__init__()
+        self.enabled = enabled
+        self.marks: dict[str, float] = {}
+        self.background: dict[str, float] = {}
+        self._previous = _START
+        self._reported = False
+
+    def mark(self, phase: str) -> None:
+        if phase in self.marks:
+            return
+        now = time.perf_counter()
+        self.marks[phase] = now - self._previous
+        self._previous = now
+        self.maybe_report()
+
+    def record(self, phase: str, seconds: float) -> None:
+        self.background.setdefault(phase, seconds)
+
+    def maybe_report(self) -> None:
+        if not self.enabled or self._reported:
+            return
+        if all(name in self.marks for name in STARTUP_PHASES) and all(
+            name in self.background for name in BACKGROUND_PHASES
+        ):
+            self._reported = True
+            self.report()
+
+    def report(self) -> None:
+        total = 0.0
+        for phase in STARTUP_PHASES:
+            duration = self.marks[phase]
+            total += duration
+            print(f"{phase:<12} {duration * 1e3:8.1f} ms  (итого {total * 1e3:8.1f} ms)", file=sys.stderr)
+        for phase in BACKGROUND_PHASES:
+            print(f"{phase:<12} {self.background[phase] * 1e3:8.1f} ms  (в фоне)", file=sys.stderr)
+
+    def eventFilter(self, watched: QtCore.QObject, event: QtCore.QEvent) -> bool:
+        if event.type() == QtCore.QEvent.Type.Paint:
+            self.mark("first_paint")
+        return False
+
+
+def _load_tts(window: CoolCatWindow, profiler: StartupProfiler) -> None:
+    # `say -v ?` может работать заметное время, поэтому голоса ищем в фоне.
+    started = time.perf_counter()
+    from .tts import TextToSpeech
 
-def main() -> int:
-    app = QtWidgets.QApplication(sys.argv)
     tts = TextToSpeech()
-    cat_state = CatState()
-    window = CoolCatWindow(tts=tts, cat_state=cat_state)
+    profiler.record("tts", time.perf_counter() - started)
+    window.tts_ready.emit(tts)
+
+
+def start(argv: list[str]) -> tuple[QtWidgets.QApplication, CoolCatWindow]:
+    """Поэтапный запуск до входа в цикл событий: окно показано, TTS грузится в фоне."""
+    parser = argparse.ArgumentParser(prog="cool_cat")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Напечатать время каждой фазы запуска.",
+    )
+    args, qt_args = parser.parse_known_args(argv[1:])
+    profiler = StartupProfiler(enabled=args.profile_startup)
+    profiler.mark("imports")
+
+    app = QtWidgets.QApplication([argv[0], *qt_args])
+    profiler.mark("app")
+    window = CoolCatWindow(tts=None, cat_state=CatState())
     window.resize(1200, 860)
+    window.image_loaded.connect(lambda: profiler.record("image", window.image_decode_seconds))
+    window.image_loaded.connect(profiler.maybe_report)
+    window.tts_ready.connect(lambda _tts: profiler.maybe_report())
+    profiler.setParent(window)
+    profiler.mark("window")
+    window.installEventFilter(profiler)
     window.show()
-    return app.exec()
+    profiler.mark("show")
+    threading.Thread(target=_load_tts, args=(window, profiler), daemon=True).start()
+    return app, window
+
 
+def main() -> int:
+    app, _window = start(sys.argv)
+    return app.exec()
 
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import itertools
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+
+@dataclass
+class UtteranceMetrics:
+    """Замеры одной фразы в секундах.
+
+    `queue_wait`, `first_audio` и `total` отсчитываются от вызова `speak`,
+    `spawn` — длительность запуска первого процесса.
+    """
+
+    chars: int
+    chunks: int
+    started_at: float = field(default_factory=time.time)
+    seq: int = -1
+    queue_wait: float | None = None
+    spawn: float | None = None
+    first_audio: float | None = None
+    total: float | None = None
+    failure: str | None = None
+
+
+class SpeechMetrics:
+    """Кольцевой буфер последних замеров озвучки.
+
+    Запись не берёт блокировок: номер слота выдаёт `itertools.count`, а
+    `next()` на нём атомарен под GIL. Читатели получают снимок буфера и
+    могут не увидеть запись, которая происходит прямо сейчас.
+    """
+
+    def __init__(self, capacity: int = 256) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._slots: list[UtteranceMetrics | None] = [None] * capacity
+        self._counter = itertools.count()
+
+    def record(self, metrics: UtteranceMetrics) -> None:
+        metrics.seq = next(self._counter)
+        self._slots[metrics.seq % self.capacity] = metrics
+
+    def snapshot(self) -> list[UtteranceMetrics]:
+        return sorted((item for item in list(self._slots) if item is not None), key=lambda item: item.seq)
+
+    def percentiles(
+        self,
+        name: str,
+        quantiles: tuple[int, ...] = (50, 95),
+    ) -> dict[int, float]:
+        values = sorted(
+            value for item in self.snapshot() if (value := getattr(item, name)) is not None
+        )
+        if not values:
+            return {}
+        # Ближайший ранг: без интерполяции, значение всегда из выборки.
+        return {q: values[max(0, -(-q * len(values) // 100) - 1)] for q in quantiles}
+
+    def export_ndjson(self, path: Path) -> int:
+        items = self.snapshot()
+        with Path(path).open("w", encoding="utf-8") as handle:
+            for item in items:
+                handle.write(json.dumps(asdict(item), ensure_ascii=False) + "\n")
+        return len(items)
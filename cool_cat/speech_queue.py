@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .tts import TextToSpeech
+
+
+class SpeechQueue:
+    """Озвучивает фразы в одном фоновом потоке.
+
+    GUI только ставит фразы в очередь и поэтому никогда не ждёт `say`.
+    Поколение фразы берётся при постановке: новая фраза вытесняет и
+    текущую (на границе фрагмента), и все ещё не начатые.
+    """
+
+    def __init__(self, tts: TextToSpeech) -> None:
+        self.tts = tts
+        self._queue: queue.Queue[tuple[str, str, float, int]] = queue.Queue()
+        self._thread: threading.Thread | None = None
+
+    def submit(self, text: str, language: str) -> None:
+        generation = self.tts.next_generation()
+        self._queue.put((text, language, time.perf_counter(), generation))
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def cancel(self) -> None:
+        """Выбрасывает ждущие фразы и останавливает текущую."""
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+            self._queue.task_done()
+        self.tts.cancel()
+
+    def join(self) -> None:
+        self._queue.join()
+
+    def _run(self) -> None:
+        while True:
+            text, language, queued_at, generation = self._queue.get()
+            try:
+                self.tts.speak(text, language, queued_at=queued_at, generation=generation)
+            finally:
+                self._queue.task_done()
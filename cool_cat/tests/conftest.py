@@ -0,0 +1,15 @@
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture()
+def window():
+    pytest.importorskip("PySide6")
+    from cool_cat.benchmarks.harness import make_window
+
+    window = make_window()
+    yield window
+    window.close()
@@ -0,0 +1,42 @@
+import pytest
+
+from cool_cat.benchmarks.run import compare, measure, same_environment
+
+
+def test_measure_reports_milliseconds() -> None:
+    result = measure(lambda: None, repeat=5)
+    assert result["unit"] == "ms"
+    assert result["runs"] == 5
+    assert result["min"] <= result["median"] <= result["p95"]
+
+
+def test_compare_flags_only_regressions_beyond_tolerance() -> None:
+    baseline = {"fast": {"median": 1.0}, "slow": {"median": 1.0}}
+    results = {"fast": {"median": 1.4}, "slow": {"median": 1.6}, "new": {"median": 9.0}}
+    regressions = compare(results, baseline, tolerance=0.5)
+    assert len(regressions) == 1
+    assert regressions[0].startswith("slow:")
+
+
+def test_compare_ignores_tiny_absolute_changes() -> None:
+    baseline = {"micro": {"median": 0.002}}
+    results = {"micro": {"median": 0.02}}
+    assert compare(results, baseline, tolerance=0.5) == []
+    assert compare(results, baseline, tolerance=0.5, min_delta_ms=0.001) != []
+
+
+def test_same_environment_ignores_kernel_build() -> None:
+    baseline = {"system": "Linux", "machine": "x86_64", "python": "3.11", "platform": "Linux-6.1-a"}
+    assert same_environment(baseline, {**baseline, "platform": "Linux-6.8-b"})
+    assert not same_environment(baseline, {**baseline, "python": "3.12"})
+
+
+def test_cat_image_restores_original_path() -> None:
+    pytest.importorskip("PySide6")
+    from cool_cat import ui
+    from cool_cat.benchmarks.run import _cat_image
+
+    original = ui.CAT_IMAGE_PATH
+    with _cat_image():
+        assert ui.CAT_IMAGE_PATH.exists()
+    assert ui.CAT_IMAGE_PATH == original
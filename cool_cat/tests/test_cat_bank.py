@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from cool_cat import config
+from cool_cat.cat_bank import CatStateBank
+from cool_cat.cat_state import CatState
+
+satiety_values = st.integers(min_value=config.SATIETY_MIN, max_value=config.SATIETY_MAX)
+elapsed_values = st.floats(min_value=-5.0, max_value=config.SATIETY_DECAY_INTERVAL * 30)
+operations = st.lists(
+    st.one_of(
+        st.tuples(st.just("tick"), elapsed_values),
+        st.tuples(st.just("feed"), st.lists(st.integers(min_value=0, max_value=4), max_size=6)),
+    ),
+    max_size=25,
+)
+
+
+def assert_bank_matches(bank: CatStateBank, states: list[CatState]) -> None:
+    assert bank.satiety.tolist() == [state.satiety for state in states]
+    assert bank.decay_elapsed.tolist() == [state._decay_elapsed for state in states]
+    assert bank.hungry_mask().tolist() == [state.is_hungry() for state in states]
+
+
+@given(
+    st.lists(st.tuples(satiety_values, satiety_values), min_size=5, max_size=5),
+    operations,
+)
+def test_bank_matches_cat_state(initial: list[tuple[int, int]], ops: list[tuple]) -> None:
+    states = [CatState(satiety=satiety, threshold_hungry=threshold) for satiety, threshold in initial]
+    bank = CatStateBank.from_states(states)
+    for name, arg in ops:
+        if name == "tick":
+            changed = bank.tick(arg)
+            assert changed.tolist() == [state.tick(arg) for state in states]
+        else:
+            bank.feed(arg)
+            for index in arg:
+                states[index].feed()
+        assert_bank_matches(bank, states)
+
+
+@given(satiety_values, st.lists(elapsed_values, max_size=20))
+def test_view_matches_cat_state(satiety: int, elapsed: list[float]) -> None:
+    bank = CatStateBank(3, satiety=satiety)
+    view = bank.view(1)
+    state = CatState(satiety=satiety)
+    for value in elapsed:
+        assert view.tick(value) == state.tick(value)
+        assert view.satiety == state.satiety
+        assert view.is_hungry() == state.is_hungry()
+    view.feed()
+    state.feed()
+    assert view.satiety == state.satiety
+    assert bank.satiety[0] == bank.satiety[2] == satiety
+
+
+def test_feed_counts_repeated_indices() -> None:
+    bank = CatStateBank(2, satiety=10)
+    bank.feed([0, 0, 0])
+    assert bank.satiety.tolist() == [10 + 3 * config.SATIETY_FEED_AMOUNT, 10]
+
+
+def test_tick_returns_empty_mask_for_non_positive_elapsed() -> None:
+    bank = CatStateBank(4)
+    assert not bank.tick(0).any()
+    assert np.all(bank.decay_elapsed == 0.0)
+
+
+def test_feed_accepts_boolean_mask() -> None:
+    bank = CatStateBank(6, satiety=10)
+    bank.satiety[1] = config.SATIETY_MAX
+    bank.feed(bank.hungry_mask())
+    expected = [10 + config.SATIETY_FEED_AMOUNT] * 6
+    expected[1] = config.SATIETY_MAX
+    assert bank.satiety.tolist() == expected
+
+
+def test_feed_rejects_non_integer_indices() -> None:
+    bank = CatStateBank(2)
+    with pytest.raises(TypeError):
+        bank.feed([0.5])
@@ -0,0 +1,28 @@
+import json
+
+from cool_cat.speech_metrics import SpeechMetrics, UtteranceMetrics
+
+
+def test_ring_keeps_latest_records() -> None:
+    metrics = SpeechMetrics(capacity=3)
+    for index in range(5):
+        metrics.record(UtteranceMetrics(chars=index, chunks=1))
+    assert [item.chars for item in metrics.snapshot()] == [2, 3, 4]
+
+
+def test_percentiles_use_nearest_rank_and_skip_missing() -> None:
+    metrics = SpeechMetrics()
+    for total in (0.1, 0.2, 0.3, 0.4, None):
+        metrics.record(UtteranceMetrics(chars=1, chunks=1, total=total))
+    assert metrics.percentiles("total", (50, 95)) == {50: 0.2, 95: 0.4}
+    assert metrics.percentiles("spawn") == {}
+
+
+def test_export_ndjson(tmp_path) -> None:
+    metrics = SpeechMetrics()
+    metrics.record(UtteranceMetrics(chars=5, chunks=1, failure="cancelled"))
+    path = tmp_path / "metrics.ndjson"
+    assert metrics.export_ndjson(path) == 1
+    row = json.loads(path.read_text(encoding="utf-8").splitlines()[0])
+    assert row["failure"] == "cancelled"
+    assert row["seq"] == 0
@@ -0,0 +1,143 @@
+import threading
+
+from cool_cat.speech_queue import SpeechQueue
+from cool_cat.tts import TextToSpeech, split_into_chunks
+
+
+class _FakePlayer:
+    returncode = 0
+
+    def __init__(self, events: list[str], name: str) -> None:
+        self.events = events
+        self.name = name
+
+    def wait(self) -> int:
+        self.events.append(f"done {self.name}")
+        return 0
+
+
+class _RecordingTextToSpeech(TextToSpeech):
+    def __init__(self, cancel_after: str | None = None) -> None:
+        super().__init__()
+        self._platform = "darwin"
+        self.events: list[str] = []
+        self.cancel_after = cancel_after
+
+    def _render_chunk(self, chunk, voice, path, record) -> None:
+        self.events.append(f"render {chunk}")
+
+    def _start_playback(self, path, record):
+        chunk = path.stem
+        self.events.append(f"play {chunk}")
+        if chunk == self.cancel_after:
+            self.cancel()
+        return _FakePlayer(self.events, chunk)
+
+
+def test_split_into_chunks_on_sentences() -> None:
+    text = "Привет, кот! Как дела? Я принёс рыбу."
+    assert split_into_chunks(text) == ["Привет, кот!", "Как дела?", "Я принёс рыбу."]
+
+
+def test_split_into_chunks_breaks_long_sentence_on_clauses() -> None:
+    text = "один, два, три, четыре."
+    assert split_into_chunks(text, max_chars=10) == ["один, два,", "три,", "четыре."]
+
+
+def test_next_chunk_renders_while_previous_plays() -> None:
+    tts = _RecordingTextToSpeech()
+    assert tts.speak("Раз. Два.", "ru") is True
+    assert tts.events == [
+        "render Раз.",
+        "play chunk0",
+        "render Два.",
+        "done chunk0",
+        "play chunk1",
+        "done chunk1",
+    ]
+
+
+def test_cancel_stops_at_chunk_boundary() -> None:
+    tts = _RecordingTextToSpeech(cancel_after="chunk0")
+    assert tts.speak("Раз. Два. Три.", "ru") is False
+    assert "done chunk0" in tts.events
+    assert "play chunk1" not in tts.events
+
+
+def test_speak_records_metrics() -> None:
+    tts = _RecordingTextToSpeech()
+    tts.speak("Раз. Два.", "ru")
+    (record,) = tts.metrics.snapshot()
+    assert record.chunks == 2
+    assert record.failure is None
+    assert 0 <= record.queue_wait <= record.first_audio <= record.total
+
+
+def test_cancel_is_recorded_as_failure() -> None:
+    tts = _RecordingTextToSpeech(cancel_after="chunk0")
+    tts.speak("Раз. Два.", "ru")
+    assert tts.metrics.snapshot()[-1].failure == "cancelled"
+
+
+def test_cancel_after_generation_is_taken_skips_phrase() -> None:
+    tts = _RecordingTextToSpeech()
+    generation = tts.next_generation()
+    tts.cancel()
+    assert tts.speak("Раз. Два.", "ru", generation=generation) is False
+    assert tts.events == []
+    assert tts.metrics.snapshot()[-1].failure == "cancelled"
+
+class _GatedTextToSpeech(_RecordingTextToSpeech):
+    """Останавливается в выбранной точке, пока тест не откроет `gate`."""
+
+    def __init__(self, gate_in: str) -> None:
+        super().__init__()
+        self.gate_in = gate_in
+        self.reached = threading.Event()
+        self.gate = threading.Event()
+
+    def _wait_at(self, point: str) -> None:
+        if self.gate_in == point and not self.reached.is_set():
+            self.reached.set()
+            self.gate.wait(5)
+
+    def speak(self, text, language, **kwargs) -> bool:
+        self._wait_at("speak")
+        return super().speak(text, language, **kwargs)
+
+    def _start_playback(self, path, record):
+        player = super()._start_playback(path, record)
+        self._wait_at("playback")
+        return player
+
+
+def _failures_by_text(tts: TextToSpeech, texts: list[str]) -> list[str | None]:
+    by_chars = {item.chars: item.failure for item in tts.metrics.snapshot()}
+    return [by_chars[len(text)] for text in texts]
+
+
+def test_queue_stop_between_dequeue_and_speak_is_not_lost() -> None:
+    tts = _GatedTextToSpeech(gate_in="speak")
+    speech = SpeechQueue(tts)
+    speech.submit("S1. S2.", "ru")
+    assert tts.reached.wait(5)
+    speech.cancel()
+    tts.gate.set()
+    speech.join()
+    assert tts.events == []
+    assert tts.metrics.snapshot()[-1].failure == "cancelled"
+
+
+def test_queue_new_phrase_supersedes_queued_ones() -> None:
+    tts = _GatedTextToSpeech(gate_in="playback")
+    speech = SpeechQueue(tts)
+    phrases = ["Икс один. Икс два. Икс три.", "А1. А2.", "Бэ первое. Бэ второе."]
+    speech.submit(phrases[0], "ru")
+    assert tts.reached.wait(5)
+    speech.submit(phrases[1], "ru")
+    speech.submit(phrases[2], "ru")
+    tts.gate.set()
+    speech.join()
+    renders = [event for event in tts.events if event.startswith("render")]
+    assert renders == ["render Икс один.", "render Икс два.", "render Бэ первое.", "render Бэ второе."]
+    assert _failures_by_text(tts, phrases) == ["cancelled", "cancelled", None]
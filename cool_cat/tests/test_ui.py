@@ -0,0 +1,155 @@
+import pytest
+
+from cool_cat import config
+
+
+def test_feed_raises_satiety_and_speaks(window) -> None:
+    window.cat_state.satiety = 10
+    window.handle_feed()
+    assert window.cat_state.satiety == 10 + config.SATIETY_FEED_AMOUNT
+    assert window.satiety_bar.value() == window.cat_state.satiety
+    window.speech.join()
+    assert len(window.tts.spoken) == 1
+
+
+def test_speak_repeats_text_when_full(window) -> None:
+    window.cat_state.satiety = config.SATIETY_MAX
+    window.text_input.setText("Привет")
+    window.handle_speak()
+    window.speech.join()
+    assert window.tts.spoken == [("Привет", "ru")]
+    assert window.text_input.text() == ""
+
+
+def test_stop_cancels_speech(window) -> None:
+    window.stop_button.click()
+    assert window.tts.cancelled == 1
+
+
+def test_speak_refuses_when_hungry(window) -> None:
+    window.cat_state.satiety = config.SATIETY_MIN
+    window.text_input.setText("Привет")
+    window.handle_speak()
+    window.speech.join()
+    assert window.tts.spoken[0][0] != "Привет"
+    assert window.text_input.text() == "Привет"
+
+
+def test_speak_requires_text(window) -> None:
+    window.handle_speak()
+    assert window.error_label.text()
+    assert window.tts.spoken == []
+
+
+def test_window_works_before_tts_is_ready(window) -> None:
+    stub = window.tts
+    window.tts = None
+    window.speech = None
+    window.update_voice_status()
+    assert "загрузка" in window.voice_status_label.text()
+    window.handle_pet()
+    assert stub.spoken == []
+    window.tts_ready.emit(stub)
+    assert window.voice_status_label.text() == "Голос: Stub"
+    window.handle_pet()
+    window.speech.join()
+    assert len(stub.spoken) == 1
+
+
+def test_handlers_do_not_wait_for_speech(window) -> None:
+    import threading
+    import time
+
+    release = threading.Event()
+    original = window.tts.speak
+
+    def slow_speak(text, language, **kwargs) -> bool:
+        release.wait(5)
+        return original(text, language, **kwargs)
+
+    window.tts.speak = slow_speak
+    started = time.perf_counter()
+    window.handle_feed()
+    window.handle_pet()
+    window.stop_button.click()
+    assert time.perf_counter() - started < 1
+    release.set()
+    window.speech.join()
+    assert len(window.tts.spoken) <= 1
+
+
+def test_load_cat_image_without_asset(window, monkeypatch, tmp_path) -> None:
+    from cool_cat import ui
+
+    monkeypatch.setattr(ui, "CAT_IMAGE_PATH", tmp_path / "missing.png")
+    window.load_cat_image()
+    assert window.image_label.text() == "Нет изображения"
+
+
+def test_diagnostics_show_percentiles(window) -> None:
+    from cool_cat.speech_metrics import UtteranceMetrics
+
+    assert window.diagnostics_label.text() == "Нет данных."
+    window.tts.metrics.record(UtteranceMetrics(chars=3, chunks=1, queue_wait=0.0, total=0.5, failure="say exit 1"))
+    window.refresh_diagnostics()
+    text = window.diagnostics_label.text()
+    assert "Фраз: 1, ошибок: 1" in text
+    assert "500 мс" in text
+    assert "say exit 1" in text
+
+
+def test_each_window_gets_cat_image_once(monkeypatch, tmp_path) -> None:
+    pytest.importorskip("PySide6")
+    from PySide6 import QtCore, QtGui
+
+    from cool_cat import ui
+    from cool_cat.benchmarks.harness import make_window, offscreen_app
+
+    app = offscreen_app()
+    path = tmp_path / "cat.png"
+    image = QtGui.QImage(64, 64, QtGui.QImage.Format.Format_ARGB32)
+    image.fill(QtGui.QColor("#d08040"))
+    image.save(str(path))
+    monkeypatch.setattr(ui, "CAT_IMAGE_PATH", path)
+    monkeypatch.setattr(ui, "_image_loader", None)
+
+    calls: dict[int, int] = {}
+    original = ui.CoolCatWindow.set_cat_image
+
+    def counting(self, image) -> None:
+        calls[id(self)] = calls.get(id(self), 0) + 1
+        original(self, image)
+
+    monkeypatch.setattr(ui.CoolCatWindow, "set_cat_image", counting)
+    windows = [make_window(), make_window()]
+    deadline = QtCore.QDeadlineTimer(5000)
+    while len(calls) < 2 and not deadline.hasExpired():
+        app.processEvents(QtCore.QEventLoop.ProcessEventsFlag.AllEvents, 50)
+    windows.append(make_window())
+    for _ in range(5):
+        app.processEvents(QtCore.QEventLoop.ProcessEventsFlag.AllEvents, 20)
+
+    assert [calls.get(id(window)) for window in windows] == [1, 1, 1]
+    assert all(window.image_label.pixmap() and not window.image_label.pixmap().isNull() for window in windows)
+    for window in windows:
+        window.close()
+
+
+def test_window_bound_to_bank_slot_does_not_tick_it() -> None:
+    pytest.importorskip("PySide6")
+    from cool_cat.benchmarks.harness import StubTextToSpeech, offscreen_app
+    from cool_cat.cat_bank import CatStateBank
+    from cool_cat.ui import CoolCatWindow
+
+    offscreen_app()
+    bank = CatStateBank(3, satiety=50)
+    window = CoolCatWindow(tts=StubTextToSpeech(), cat_state=bank.view(1), tick_state=False)
+    window._last_tick -= config.SATIETY_DECAY_INTERVAL * 5
+    bank.tick(config.SATIETY_DECAY_INTERVAL)
+    window.on_timer_tick()
+    assert bank.satiety.tolist() == [49, 49, 49]
+    assert window.satiety_bar.value() == 49
+    window.handle_feed()
+    window.speech.join()
+    assert bank.satiety.tolist() == [49, 49 + config.SATIETY_FEED_AMOUNT, 49]
+    window.close()
@@ -1,10 +1,44 @@
 from __future__ import annotations
 
+import itertools
 import platform
+import re
 import subprocess
+import tempfile
+import threading
+import time
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Iterable
 
+from .speech_metrics import SpeechMetrics, UtteranceMetrics
+
+MAX_CHUNK_CHARS = 120
+
+_SENTENCE_END = re.compile(r"(?<=[.!?…])\s+")
+_CLAUSE_END = re.compile(r"(?<=[,;:—])\s+")
+
+
+def split_into_chunks(text: str, max_chars: int = MAX_CHUNK_CHARS) -> list[str]:
+    """Делит текст на предложения, а слишком длинные — ещё и по запятым."""
+    chunks: list[str] = []
+    for sentence in _SENTENCE_END.split(text.strip()):
+        if not sentence:
+            continue
+        if len(sentence) <= max_chars:
+            chunks.append(sentence)
+            continue
+        current = ""
+        for clause in _CLAUSE_END.split(sentence):
+            if current and len(current) + 1 + len(clause) > max_chars:
+                chunks.append(current)
+                current = clause
+            else:
+                current = f"{current} {clause}" if current else clause
+        if current:
+            chunks.append(current)
+    return chunks
+
 
 @dataclass
 class VoiceInfo:
@@ -15,6 +49,13 @@ class VoiceInfo:
 class TextToSpeech:
     def __init__(self) -> None:
         self._platform = platform.system().lower()
+        # Каждая фраза и каждая отмена берут новое поколение; фраза играет,
+        # пока её поколение остаётся последним. В отличие от общего флага,
+        # отмену нельзя «стереть» фразой, которая стартовала позже.
+        self._generations = itertools.count(1)
+        self._generation_lock = threading.Lock()
+        self._generation = 0
+        self.metrics = SpeechMetrics()
         self._ru_voice = VoiceInfo(name=None)
         self._en_voice = VoiceInfo(name=None)
         if self._platform == "darwin":
@@ -76,16 +117,122 @@ class TextToSpeech:
             return self._ru_voice
         return self._en_voice
 
-    def speak(self, text: str, language: str) -> bool:
+    def cancel(self) -> None:
+        """Останавливает текущую и ждущие фразы на границе ближайшего фрагмента."""
+        self.next_generation()
+
+    def next_generation(self) -> int:
+        """Выдаёт поколение для новой фразы; все более ранние фразы отменяются."""
+        with self._generation_lock:
+            self._generation = next(self._generations)
+            return self._generation
+
+    def _superseded(self, generation: int) -> bool:
+        return generation != self._generation
+
+    def speak(
+        self,
+        text: str,
+        language: str,
+        queued_at: float | None = None,
+        generation: int | None = None,
+    ) -> bool:
+        """Озвучивает текст и записывает метрики фразы.
+
+        Не рассчитан на параллельные вызовы: в приложении его вызывает только
+        поток `SpeechQueue`.
+        """
+        if queued_at is None:
+            queued_at = time.perf_counter()
+        chunks = split_into_chunks(text)
+        record = UtteranceMetrics(chars=len(text), chunks=max(1, len(chunks)))
         if self._platform != "darwin":
+            record.failure = "unsupported platform"
+            self.metrics.record(record)
             return False
         voice = self.voice_info(language).name
+        # Новая фраза прерывает предыдущую, как только та доиграет фрагмент.
+        # Очередь берёт поколение заранее, в момент постановки фразы, чтобы
+        # отмена между постановкой и стартом не терялась.
+        if generation is None:
+            generation = self.next_generation()
+        record.queue_wait = time.perf_counter() - queued_at
+        try:
+            if self._superseded(generation):
+                record.failure = "cancelled"
+            elif len(chunks) <= 1:
+                process = self._spawn(self._say_command(voice, text), record)
+                self._mark_first_audio(record, queued_at)
+                if process.wait() != 0:
+                    record.failure = f"say exit {process.returncode}"
+            else:
+                self._speak_chunks(chunks, voice, generation, record, queued_at)
+        except subprocess.CalledProcessError as exc:
+            record.failure = f"{exc.cmd[0]} exit {exc.returncode}"
+        except FileNotFoundError as exc:
+            record.failure = f"not found: {exc.filename}"
+        finally:
+            record.total = time.perf_counter() - queued_at
+            self.metrics.record(record)
+        return record.failure is None
+
+    def _speak_chunks(
+        self,
+        chunks: list[str],
+        voice: str | None,
+        generation: int,
+        record: UtteranceMetrics,
+        queued_at: float,
+    ) -> None:
+        # Конвейер: фрагмент N играет, пока рендерится фрагмент N+1.
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = [Path(tmp) / f"chunk{index}.aiff" for index in range(len(chunks))]
+            self._render_chunk(chunks[0], voice, paths[0], record)
+            for index, path in enumerate(paths):
+                if self._superseded(generation):
+                    record.failure = "cancelled"
+                    return
+                player = self._start_playback(path, record)
+                self._mark_first_audio(record, queued_at)
+                try:
+                    if index + 1 < len(chunks):
+                        self._render_chunk(chunks[index + 1], voice, paths[index + 1], record)
+                finally:
+                    player.wait()
+                if player.returncode != 0:
+                    record.failure = f"afplay exit {player.returncode}"
+                    return
+
+    @staticmethod
+    def _spawn(command: list[str], record: UtteranceMetrics) -> subprocess.Popen:
+        started = time.perf_counter()
+        process = subprocess.Popen(command)
+        if record.spawn is None:
+            record.spawn = time.perf_counter() - started
+        return process
+
+    @staticmethod
+    def _mark_first_audio(record: UtteranceMetrics, queued_at: float) -> None:
+        # Точный момент начала звука `say` не сообщает; считаем им запуск
+        # процесса, который воспроизводит звук.
+        if record.first_audio is None:
+            record.first_audio = time.perf_counter() - queued_at
+
+    @staticmethod
+    def _say_command(voice: str | None, text: str) -> list[str]:
         command = ["say"]
         if voice:
             command.extend(["-v", voice])
         command.append(text)
-        try:
-            subprocess.run(command, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
-        return True
+        return command
+
+    def _render_chunk(self, chunk: str, voice: str | None, path: Path, record: UtteranceMetrics) -> None:
+        command = self._say_command(voice, chunk)
+        command[1:1] = ["-o", str(path)]
+        returncode = self._spawn(command, record).wait()
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, command)
+
+    def _start_playback(self, path: Path, record: UtteranceMetrics) -> subprocess.Popen:
+        return self._spawn(["afplay", str(path)], record)
+
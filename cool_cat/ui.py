@@ -1,14 +1,20 @@
 from __future__ import annotations
 
 import random
+import threading
 import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
 from . import config
 from .cat_state import CatState
-from .tts import TextToSpeech
+from .speech_queue import SpeechQueue
+
+if TYPE_CHECKING:
+    from .cat_bank import CatStateView
+    from .tts import TextToSpeech
 
 ASSETS_DIR = Path(__file__).resolve().parent / "assets"
 CAT_IMAGE_PATH = ASSETS_DIR / "cat.png"
@@ -83,6 +89,13 @@ PETTING_HUNGRY_EN = [
     "Purr? Not without food.",
 ]
 
+DIAGNOSTIC_ROWS = [
+    ("queue_wait", "Очередь"),
+    ("spawn", "Запуск"),
+    ("first_audio", "Первый звук"),
+    ("total", "Всего"),
+]
+
 FEED_RU = [
     "Вот это другое дело.",
     "Нормально. Продолжай.",
@@ -96,12 +109,87 @@ FEED_EN = [
 ]
 
 
+def read_cat_image(path: Path | None = None) -> QtGui.QImage | None:
+    path = CAT_IMAGE_PATH if path is None else path
+    if path.exists():
+        image = QtGui.QImage(str(path))
+        if not image.isNull():
+            return image
+    return None
+
+
+class _CatImageLoader(QtCore.QObject):
+    """Декодирует картинку кота в фоне один раз и кэширует результат.
+
+    Живёт всё время работы приложения, поэтому фоновый поток никогда не
+    держит последнюю ссылку на окно. QImage можно читать вне GUI-потока,
+    QPixmap из неё окна делают уже у себя.
+    """
+
+    _decoded = QtCore.Signal(object, object, float)
+    ready = QtCore.Signal(object, float)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._cache: dict[Path, tuple[QtGui.QImage | None, float]] = {}
+        self._started: set[Path] = set()
+        # Кэш и раздача окнам — только в GUI-потоке, поэтому окно не может
+        # подключиться между декодированием и рассылкой и остаться без картинки.
+        self._decoded.connect(self._store)
+
+    def request(self, window: CoolCatWindow) -> None:
+        path = CAT_IMAGE_PATH
+        if path in self._cache:
+            window.receive_cat_image(*self._cache[path])
+            return
+        # Одноразовое соединение: окно получает ровно одну картинку, а
+        # закрытые окна не копят слоты на общем загрузчике.
+        self.ready.connect(window.receive_cat_image, QtCore.Qt.ConnectionType.SingleShotConnection)
+        if path not in self._started:
+            self._started.add(path)
+            threading.Thread(target=self._run, args=(path,), daemon=True).start()
+
+    def _run(self, path: Path) -> None:
+        started = time.perf_counter()
+        image = read_cat_image(path)
+        self._decoded.emit(path, image, time.perf_counter() - started)
+
+    def _store(self, path: Path, image: QtGui.QImage | None, seconds: float) -> None:
+        self._cache[path] = (image, seconds)
+        self.ready.emit(image, seconds)
+
+
+_image_loader: _CatImageLoader | None = None
+
+
+def _cat_image_loader() -> _CatImageLoader:
+    global _image_loader
+    if _image_loader is None:
+        _image_loader = _CatImageLoader()
+    return _image_loader
+
+
 class CoolCatWindow(QtWidgets.QMainWindow):
-    def __init__(self, tts: TextToSpeech, cat_state: CatState) -> None:
+    tts_ready = QtCore.Signal(object)
+    image_loaded = QtCore.Signal()
+
+    def __init__(
+        self,
+        tts: TextToSpeech | None,
+        cat_state: CatState | CatStateView,
+        tick_state: bool = True,
+    ) -> None:
         super().__init__()
         self.setWindowTitle("Крутой Кот")
         self.tts = tts
         self.cat_state = cat_state
+        # False — время кота продвигает кто-то снаружи (например, общий
+        # `CatStateBank`), а окно по таймеру только перечитывает состояние.
+        self.tick_state = tick_state
+        self._cat_pixmap: QtGui.QPixmap | None = None
+        self._image_pending = True
+        self.image_decode_seconds = 0.0
+        self.speech = SpeechQueue(tts) if tts is not None else None
         self._last_reply: dict[str, str] = {}
         self._last_tick = time.monotonic()
 
@@ -161,19 +249,35 @@ class CoolCatWindow(QtWidgets.QMainWindow):
         self.error_label.setStyleSheet("color: #ff8f8f;")
         control_layout.addWidget(self.error_label)
 
+        speak_layout = QtWidgets.QHBoxLayout()
         self.speak_button = QtWidgets.QPushButton("Озвучить")
-        control_layout.addWidget(self.speak_button)
+        self.stop_button = QtWidgets.QPushButton("Стоп")
+        speak_layout.addWidget(self.speak_button, stretch=1)
+        speak_layout.addWidget(self.stop_button)
+        control_layout.addLayout(speak_layout)
 
         self.log_box = QtWidgets.QTextEdit()
         self.log_box.setReadOnly(True)
         control_layout.addWidget(self.log_box, stretch=1)
 
+        diagnostics_box = QtWidgets.QGroupBox("Диагностика озвучки")
+        diagnostics_layout = QtWidgets.QVBoxLayout(diagnostics_box)
+        self.diagnostics_label = QtWidgets.QLabel("")
+        self.diagnostics_label.setFont(QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.SystemFont.FixedFont))
+        self.export_metrics_button = QtWidgets.QPushButton("Экспорт в ndjson")
+        diagnostics_layout.addWidget(self.diagnostics_label)
+        diagnostics_layout.addWidget(self.export_metrics_button)
+        control_layout.addWidget(diagnostics_box)
+
         main_layout.addWidget(control_panel, stretch=1)
 
         self.feed_button.clicked.connect(self.handle_feed)
         self.pet_button.clicked.connect(self.handle_pet)
         self.speak_button.clicked.connect(self.handle_speak)
+        self.stop_button.clicked.connect(self.handle_stop)
+        self.export_metrics_button.clicked.connect(self.handle_export_metrics)
         self.language_combo.currentIndexChanged.connect(self.update_voice_status)
+        self.tts_ready.connect(self.set_tts)
 
         self.timer = QtCore.QTimer(self)
         self.timer.setInterval(1000)
@@ -183,30 +287,62 @@ class CoolCatWindow(QtWidgets.QMainWindow):
         self.update_voice_status()
         self.update_cat_image()
         self.refresh_satiety_ui()
+        self.refresh_diagnostics()
+        # Картинка декодируется в фоне, чтобы не задерживать первый кадр.
+        _cat_image_loader().request(self)
 
     def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
         super().resizeEvent(event)
         self.update_cat_image()
 
+    def load_cat_image(self) -> None:
+        started = time.perf_counter()
+        image = read_cat_image()
+        self.receive_cat_image(image, time.perf_counter() - started)
+
+    def receive_cat_image(self, image: QtGui.QImage | None, decode_seconds: float) -> None:
+        self.image_decode_seconds = decode_seconds
+        self.set_cat_image(image)
+
+    def set_cat_image(self, image: QtGui.QImage | None) -> None:
+        self._cat_pixmap = QtGui.QPixmap.fromImage(image) if image is not None else None
+        self._image_pending = False
+        self.update_cat_image()
+        self.image_loaded.emit()
+
     def update_cat_image(self) -> None:
-        if CAT_IMAGE_PATH.exists():
-            pixmap = QtGui.QPixmap(str(CAT_IMAGE_PATH))
-            if not pixmap.isNull():
-                scaled = pixmap.scaled(
-                    self.image_label.size(),
-                    QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-                    QtCore.Qt.TransformationMode.SmoothTransformation,
-                )
-                self.image_label.setPixmap(scaled)
-                self.image_label.setText("")
-                return
+        if self._cat_pixmap is not None:
+            scaled = self._cat_pixmap.scaled(
+                self.image_label.size(),
+                QtCore.Qt.AspectRatioMode.KeepAspectRatio,
+                QtCore.Qt.TransformationMode.SmoothTransformation,
+            )
+            self.image_label.setPixmap(scaled)
+            self.image_label.setText("")
+            return
         self.image_label.setPixmap(QtGui.QPixmap())
-        self.image_label.setText("Нет изображения")
+        self.image_label.setText("Загрузка…" if self._image_pending else "Нет изображения")
 
     def current_language(self) -> str:
         return self.language_combo.currentData()
 
+    def set_tts(self, tts: TextToSpeech) -> None:
+        self.tts = tts
+        self.speech = SpeechQueue(tts)
+        self.update_voice_status()
+        self.refresh_diagnostics()
+
+    def speak(self, text: str) -> None:
+        # Вся озвучка идёт через фоновую очередь: GUI-поток не ждёт `say`,
+        # и кнопка «Стоп» срабатывает на границе фрагмента.
+        if self.speech is None:
+            return
+        self.speech.submit(text, self.current_language())
+
     def update_voice_status(self) -> None:
+        if self.tts is None:
+            self.voice_status_label.setText("Голос: загрузка…")
+            return
         info = self.tts.voice_info(self.current_language())
         if info.warning:
             self.voice_status_label.setText(f"Предупреждение: {info.warning}")
@@ -220,6 +356,44 @@ class CoolCatWindow(QtWidgets.QMainWindow):
         status = "ГОЛОДЕН" if self.cat_state.is_hungry() else "СЫТ"
         self.satiety_label.setText(f"Сытость: {self.cat_state.satiety}/100 — {status}")
 
+    def refresh_diagnostics(self) -> None:
+        if self.tts is None:
+            self.diagnostics_label.setText("Нет данных.")
+            return
+        metrics = self.tts.metrics
+        snapshot = metrics.snapshot()
+        if not snapshot:
+            self.diagnostics_label.setText("Нет данных.")
+            return
+        failed = sum(1 for item in snapshot if item.failure is not None)
+        lines = [f"Фраз: {len(snapshot)}, ошибок: {failed}"]
+        for name, title in DIAGNOSTIC_ROWS:
+            values = metrics.percentiles(name, (50, 95))
+            if values:
+                lines.append(f"{title:<14} p50 {values[50] * 1e3:7.0f} мс  p95 {values[95] * 1e3:7.0f} мс")
+        last_failure = next((item.failure for item in reversed(snapshot) if item.failure), None)
+        if last_failure:
+            lines.append(f"Последняя ошибка: {last_failure}")
+        self.diagnostics_label.setText("\n".join(lines))
+
+    def handle_export_metrics(self) -> None:
+        if self.tts is None:
+            return
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self,
+            "Экспорт метрик озвучки",
+            "speech_metrics.ndjson",
+            "NDJSON (*.ndjson)",
+        )
+        if not path:
+            return
+        try:
+            count = self.tts.metrics.export_ndjson(Path(path))
+        except OSError as exc:
+            self.error_label.setText(f"Не удалось сохранить метрики: {exc}")
+            return
+        self.add_log(f"Метрики озвучки сохранены ({count}): {path}")
+
     def add_log(self, message: str) -> None:
         self.log_box.append(message)
 
@@ -228,7 +402,7 @@ class CoolCatWindow(QtWidgets.QMainWindow):
         self.refresh_satiety_ui()
         reply = self.random_reply("feed", FEED_RU if self.current_language() == "ru" else FEED_EN)
         self.add_log(f"Кот: {reply}")
-        self.tts.speak(reply, self.current_language())
+        self.speak(reply)
 
     def handle_pet(self) -> None:
         if self.cat_state.is_hungry():
@@ -237,7 +411,7 @@ class CoolCatWindow(QtWidgets.QMainWindow):
             replies = PETTING_FULL_RU if self.current_language() == "ru" else PETTING_FULL_EN
         reply = self.random_reply("pet", replies)
         self.add_log(f"Кот: {reply}")
-        self.tts.speak(reply, self.current_language())
+        self.speak(reply)
 
     def handle_speak(self) -> None:
         text = self.text_input.text().strip()
@@ -249,13 +423,17 @@ class CoolCatWindow(QtWidgets.QMainWindow):
             replies = HUNGRY_INSULTS_RU if self.current_language() == "ru" else HUNGRY_INSULTS_EN
             reply = self.random_reply("hungry", replies)
             self.add_log(f"Кот: {reply}")
-            self.tts.speak(reply, self.current_language())
+            self.speak(reply)
             return
         self.add_log(f"Пользователь: {text}")
         self.add_log(f"Кот озвучил: {text}")
-        self.tts.speak(text, self.current_language())
+        self.speak(text)
         self.text_input.clear()
 
+    def handle_stop(self) -> None:
+        if self.speech is not None:
+            self.speech.cancel()
+
     def random_reply(self, key: str, pool: list[str]) -> str:
         reply = random.choice(pool)
         last = self._last_reply.get(key)
@@ -269,5 +447,8 @@ class CoolCatWindow(QtWidgets.QMainWindow):
         now = time.monotonic()
         elapsed = now - self._last_tick
         self._last_tick = now
-        if self.cat_state.tick(elapsed):
+        self.refresh_diagnostics()
+        if not self.tick_state:
+            self.refresh_satiety_ui()
+        elif self.cat_state.tick(elapsed):
             self.refresh_satiety_ui()